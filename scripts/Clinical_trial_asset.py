@@ -1,10 +1,15 @@
+import argparse
 import requests
 import pandas as pd
 import time
-import json
-from collections import defaultdict
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+from Interactions_asset import query_gene_interactions
+from Target_categorization import STRONG_SUPPORT_THRESHOLD, assign_priority_category
+
 assets = Path("assets/")
 
 API_BASE_URL = "https://clinicaltrials.gov/api/v2/studies"
@@ -12,6 +17,8 @@ HEADERS = {"Accept": "application/json"}
 PAGE_SIZE = 100           # how many results per page request (max sensible)
 REQUEST_DELAY = 1.0       # seconds between queries to be polite
 TIMEOUT = 30              # requests timeout in seconds
+MAX_WORKERS = 8           # concurrent requests in batch mode
+OPEN_TARGETS_DELAY = 0.2  # seconds between Open Targets queries in batch mode
 
 gene_categories = {
     "Emerging Breast Cancer Target": ['CASP8'],
@@ -35,7 +42,7 @@ def search_studies_for_gene(gene_name, condition="Breast Cancer"):
     
     studies = []
     try:
-        response = requests.get(API_BASE_URL, headers=HEADERS, params=params)
+        response = requests.get(API_BASE_URL, headers=HEADERS, params=params, timeout=TIMEOUT)
         response.raise_for_status()
         data = response.json()
         
@@ -49,127 +56,6 @@ def search_studies_for_gene(gene_name, condition="Breast Cancer"):
         
     return studies
 
-def extract_study_info(study):
-    """
-    Extract structured info from a study dict. Returns a dict with desired fields.
-    """
-    proto = study.get("protocolSection", {})
-    ident = proto.get("identificationModule", {})
-    nct_id = ident.get("nctId")
-    title = ident.get("briefTitle") or ident.get("officialTitle")
-    conditions = proto.get("conditionsModule", {}).get("conditions", [])
-    # Add more extraction as needed (e.g., interventions, eligibility, contacts)
-    interventions = proto.get("interventionsModule", {}).get("interventionList", {}).get("intervention", [])
-    # Convert interventions to names if structured
-    intervention_names = []
-    for inv in interventions:
-        name = inv.get("interventionName") or inv.get("name")
-        if name:
-            intervention_names.append(name)
-
-    return {
-        "nct_id": nct_id,
-        "title": title,
-        "conditions": conditions,
-        "interventions": intervention_names,
-        # keep the raw study for deeper inspection if needed
-        "raw": study
-    }
-
-def analyze_gene_categories(*category_dicts, condition="Breast Cancer", sleep_between=REQUEST_DELAY):
-    """
-    Accepts multiple gene-category dicts, queries ClinicalTrials for each unique gene,
-    and returns structured results and summaries.
-    """
-    # Combine and dedupe genes, but keep mapping of gene -> categories
-    gene_to_categories = defaultdict(list)
-    for cat_dict in category_dicts:
-        for category, genes in cat_dict.items():
-            for g in genes:
-                gene_to_categories[g].append(category)
-
-    unique_genes = list(gene_to_categories.keys())
-
-    # storage
-    study_rows = []   # list of rows: each row = one study hit for one gene
-    summary_counts = defaultdict(dict)  # category -> gene -> count
-
-    # Query each gene once
-    for idx, gene in enumerate(unique_genes, 1):
-        studies = search_studies_for_gene(gene, condition=condition)
-
-        # Extract and store
-        for st in studies:
-            info = extract_study_info(st)
-            study_rows.append({
-                "gene": gene,
-                "nct_id": info["nct_id"],
-                "title": info["title"],
-                "conditions": "; ".join(info["conditions"]),
-                "interventions": "; ".join(info["interventions"])
-            })
-
-        # Fill per-category summary counts for this gene
-        for cat in gene_to_categories[gene]:
-            summary_counts[cat][gene] = len(studies)
-
-        time.sleep(sleep_between)  # polite delay
-
-    # Build DataFrames
-    df_studies = pd.DataFrame(study_rows)
-    # If no studies at all, ensure columns exist
-    if df_studies.empty:
-        df_studies = pd.DataFrame(columns=["gene", "nct_id", "title", "conditions", "interventions"])
-
-    # Summary DF (one row per gene with categories flattened)
-    summary_rows = []
-    for cat, gene_counts in summary_counts.items():
-        for gene, cnt in gene_counts.items():
-            summary_rows.append({"category": cat, "gene": gene, "studies_found": cnt})
-    df_summary = pd.DataFrame(summary_rows)
-
-    return df_studies, df_summary
-
-def assign_priority_category(df_summary):
-    """
-    Input:
-        df_summary: DataFrame with rows {category, gene, studies_found}
-    Returns:
-        df_final: DataFrame with one row per gene:
-                    {gene, assigned_category, studies_in_assigned_category}
-        category_priority: list of categories ordered by total studies (desc)
-    """
-
-    # Compute global category priority by total studies (desc)
-    cat_totals = df_summary.groupby('category')['studies_found'].sum().sort_values(ascending=False)
-    category_priority = list(cat_totals.index)
-    priority_index = {cat: i for i, cat in enumerate(category_priority)}
-
-    # For each gene, find candidate categories and choose best by:
-    #  a) lowest priority_index (i.e., highest priority)
-    #  b) if same priority index among candidates (tie), pick category with highest per-gene studies_found
-    #  c) if still tie, choose category by alphabetical order
-    grouped = df_summary.groupby('gene')
-
-    rows = []
-    for gene, group in grouped:
-        # group: rows for this gene across categories
-        # annotate priority index to allow sorting
-        group = group.copy()
-        group['priority_idx'] = group['category'].map(priority_index)
-        # Sort by (priority_idx asc, studies_found desc, category asc) and pick first
-        group_sorted = group.sort_values(by=['priority_idx', 'studies_found', 'category'],
-                                        ascending=[True, False, True])
-        chosen = group_sorted.iloc[0]
-        rows.append({
-            'gene': gene,
-            'category': chosen['category'],
-            'studies': int(chosen['studies_found'])
-        })
-
-    df_final = pd.DataFrame(rows).sort_values(by='gene').reset_index(drop=True)
-    return df_final, category_priority
-
 BASE_URL = "https://api.platform.opentargets.org/api/v4/graphql"
 
 def get_ensembl_id(gene_symbol):
@@ -199,14 +85,14 @@ def get_ensembl_id(gene_symbol):
     }
 
     try:
-        response = requests.post(BASE_URL, json=payload)
+        response = requests.post(BASE_URL, json=payload, timeout=TIMEOUT)
         response.raise_for_status()
         data = response.json()
         
         # Parse the response to find the Ensembl ID
         hits = data['data']['search']['hits']
         for hit in hits:
-            if hit['entity'] == 'target' and hit['object']['approvedSymbol'] == gene_symbol:
+            if hit['entity'] == 'target' and hit['object']['approvedSymbol'].upper() == gene_symbol.upper():
                 return hit['id']
     except Exception as e:
         print(f"Error finding Ensembl ID for {gene_symbol}: {e}")
@@ -247,7 +133,7 @@ def query_open_targets_drugs(ensembl_id):
     }
 
     try:
-        response = requests.post(BASE_URL, json=payload)
+        response = requests.post(BASE_URL, json=payload, timeout=TIMEOUT)
         response.raise_for_status()
         data = response.json()
         
@@ -262,48 +148,18 @@ def query_open_targets_drugs(ensembl_id):
         print(f"Error querying drugs for {ensembl_id}: {e}")
         return 'No Specific Drug'
 
-df_studies, df_summary = analyze_gene_categories(gene_categories, condition="Breast Cancer")
-df_final, category_priority = assign_priority_category(df_summary)
-
-# Load genes from your existing combined_df
-genes = df_final['gene'].unique().tolist()
-
-# Load DGIdb interactions file
-interactions_path = assets / "interactions.tsv"
-dgidb_df = pd.read_csv(interactions_path, sep="\t")
-
-# Extract unique gene names that have interactions
-targeted_genes = set(dgidb_df["gene_name"].dropna().str.upper())
-
-# Create DGIdb status dataframe
-dgidb_status_df = pd.DataFrame({
-    'gene': genes,
-    'DGIdb_Status': ['Targeted' if gene.upper() in targeted_genes else 'Not Targeted' 
-                        for gene in genes]
-})
-
-# Process all genes to get Ensembl IDs
-gene_ensembl_map = {}
-for gene in genes:
-    ensembl_id = get_ensembl_id(gene)
-    if ensembl_id:
-        gene_ensembl_map[gene] = ensembl_id
-    else:
-        gene_ensembl_map[gene] = None
-    time.sleep(0.2)
-
-# 1) Fetch all breast-cancer associated targets (single call)
-BASE_URL = "https://api.platform.opentargets.org/api/v4/graphql"
 DISEASE_EFO = "EFO_0000305"  # breast cancer
-PAGE_SIZE = 500  # increase if you expect >500 associated targets
+DISEASE_PAGE_SIZE = 500  # associated targets per page, all pages are fetched
+DEFAULT_DISEASES = [("Breast Cancer", DISEASE_EFO)]
 
 disease_query = """
-query BreastCancerTargets($efoId: String!, $size: Int!)
+query DiseaseTargets($efoId: String!, $index: Int!, $size: Int!)
 {
     disease(efoId: $efoId)
     {
-        associatedTargets(page: { index: 0, size: $size })
+        associatedTargets(page: { index: $index, size: $size })
         {
+            count
             rows
             {
                 target { approvedSymbol }
@@ -314,85 +170,295 @@ query BreastCancerTargets($efoId: String!, $size: Int!)
 }
 """
 
-resp = requests.post(
-    BASE_URL,
-    json={"query": disease_query, "variables": {"efoId": DISEASE_EFO, "size": PAGE_SIZE}},
-    timeout=30
-)
-resp.raise_for_status()
-data = resp.json()
-
-# Defensive parsing
-rows = []
-try:
-    rows = data["data"]["disease"]["associatedTargets"]["rows"]
-except Exception:
+@lru_cache(maxsize=None)
+def fetch_disease_scores(efo_id, size=DISEASE_PAGE_SIZE):
+    """
+    Fetch all targets associated with a disease, page by page, and return a dict
+    mapping uppercase gene symbol -> Open Targets association score.
+    Results are cached so each disease is only fetched once per session.
+    """
     rows = []
-
-# 2) Build a lookup dict mapping uppercase gene symbol -> score
-#    If a symbol appears multiple times, keep the maximum score (or mean — choose what makes sense).
-score_lookup = {}
-for r in rows:
-    targ = r.get("target") or {}
-    symbol = targ.get("approvedSymbol")
-    score = r.get("score")
-    if symbol and score is not None:
-        symu = symbol.upper()
+    index = 0
+    while True:
+        resp = requests.post(
+            BASE_URL,
+            json={"query": disease_query,
+                  "variables": {"efoId": efo_id, "index": index, "size": size}},
+            timeout=TIMEOUT
+        )
+        resp.raise_for_status()
+        data = resp.json()
+
+        # Defensive parsing
         try:
-            score_f = float(score)
-        except (TypeError, ValueError):
-            continue
-        # keep the highest score if duplicates occur
-        if symu in score_lookup:
-            score_lookup[symu] = max(score_lookup[symu], score_f)
-        else:
-            score_lookup[symu] = score_f
+            targets = data["data"]["disease"]["associatedTargets"]
+            page_rows = targets["rows"] or []
+            total = targets.get("count") or 0
+        except Exception:
+            page_rows, total = [], 0
+
+        rows.extend(page_rows)
+        index += 1
+        if not page_rows or len(rows) >= total:
+            break
+
+    # If a symbol appears multiple times, keep the maximum score
+    score_lookup = {}
+    for r in rows:
+        targ = r.get("target") or {}
+        symbol = targ.get("approvedSymbol")
+        score = r.get("score")
+        if symbol and score is not None:
+            symu = symbol.upper()
+            try:
+                score_f = float(score)
+            except (TypeError, ValueError):
+                continue
+            # keep the highest score if duplicates occur
+            if symu in score_lookup:
+                score_lookup[symu] = max(score_lookup[symu], score_f)
+            else:
+                score_lookup[symu] = score_f
+
+    return score_lookup
+
+def build_dgidb_status(genes, interactions_db=assets / "interactions.sqlite"):
+    """
+    Query the indexed DGIdb store built by Interactions_asset.py for the given genes.
+    Returns a DataFrame with {gene, DGIdb_Status, DGIdb_Interactions, DGIdb_Drugs}.
+    """
+    dgidb_df = query_gene_interactions(interactions_db, genes)
+
+    # Summarise interactions per gene (drug names and count of interactions)
+    dgidb_summary = dgidb_df.groupby('gene_name').agg(
+        DGIdb_Interactions=('drug_name', 'size'),
+        DGIdb_Drugs=('drug_name', lambda s: ', '.join(sorted(s.dropna().unique())))
+    )
+
+    dgidb_status_df = pd.DataFrame({'gene': list(genes)})
+    gene_keys = dgidb_status_df['gene'].str.upper()
+    dgidb_status_df['DGIdb_Status'] = gene_keys.isin(dgidb_summary.index).map(
+        {True: 'Targeted', False: 'Not Targeted'})
+    dgidb_status_df['DGIdb_Interactions'] = gene_keys.map(dgidb_summary['DGIdb_Interactions'])
+    dgidb_status_df['DGIdb_Drugs'] = gene_keys.map(dgidb_summary['DGIdb_Drugs'])
+    dgidb_status_df['DGIdb_Interactions'] = dgidb_status_df['DGIdb_Interactions'].fillna(0).astype(int)
+    dgidb_status_df['DGIdb_Drugs'] = dgidb_status_df['DGIdb_Drugs'].fillna('')
+    return dgidb_status_df
+
+class RateLimiter:
+    """
+    Thread-safe limiter shared by the worker threads of one API, so requests
+    start at least `interval` seconds apart however many workers are running.
+    """
 
-score_lookup_df = pd.DataFrame(score_lookup, index=[0]).T.reset_index()
-score_lookup_df.columns = ['gene', 'OpenTargets_Score']
-score_lookup_df.to_csv(assets / "OpenTargets_Score.csv", index=False)
+    def __init__(self, interval):
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_time = 0.0
 
-# Query both drug information and breast cancer scores
-drug_map = {}
-score_map = {}
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_time)
+            self._next_time = start + self.interval
+        time.sleep(max(0.0, start - now))
 
-for gene, ensembl_id in gene_ensembl_map.items():
-    if ensembl_id:        
-        # Get drug information
-        drug_map[gene] = query_open_targets_drugs(ensembl_id)
-        
-        # Get breast cancer association score
-        score_map[gene] = score_lookup.get(gene.upper(), 0.0)  
+def fetch_gene_drugs(genes, max_workers=MAX_WORKERS, delay=OPEN_TARGETS_DELAY):
+    """
+    Resolve each gene to its Ensembl ID and query Open Targets for approved drugs.
+    Both lookups are disease independent, so they are run once per unique gene,
+    on a bounded thread pool sharing one Open Targets rate limiter.
+    Returns a DataFrame with {gene, FDA_Approved_Drug, Has_Ensembl_ID}.
+    """
+    limiter = RateLimiter(delay)
+
+    def lookup(gene):
+        limiter.wait()
+        ensembl_id = get_ensembl_id(gene)
+        if not ensembl_id:
+            return 'No Specific Drug', False
+        limiter.wait()
+        return query_open_targets_drugs(ensembl_id), True
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(lookup, genes))
+
+    return pd.DataFrame({
+        'gene': list(genes),
+        'FDA_Approved_Drug': [drug for drug, _ in results],
+        'Has_Ensembl_ID': [found for _, found in results]
+    })
+
+def count_studies(genes, conditions, max_workers=MAX_WORKERS, delay=REQUEST_DELAY):
+    """
+    Query ClinicalTrials once per unique (gene, condition) pair, on a bounded
+    thread pool sharing one ClinicalTrials rate limiter.
+    Returns a DataFrame with {gene, condition, studies}.
+    """
+    limiter = RateLimiter(delay)
+    pairs = [(gene, condition) for condition in dict.fromkeys(conditions) for gene in genes]
+
+    def lookup(pair):
+        gene, condition = pair
+        limiter.wait()
+        return len(search_studies_for_gene(gene, condition=condition))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        counts = list(executor.map(lookup, pairs))
+
+    return pd.DataFrame(
+        [(gene, condition, n) for (gene, condition), n in zip(pairs, counts)],
+        columns=['gene', 'condition', 'studies']
+    )
 
+def run_batch_enrichment(gene_table, diseases=DEFAULT_DISEASES, gene_column='gene',
+                         interactions_db=assets / "interactions.sqlite",
+                         max_workers=MAX_WORKERS, request_delay=REQUEST_DELAY):
+    """
+    Enrich a gene table against several (condition, EFO ID) pairs.
+
+    Input:
+        gene_table: DataFrame with a gene symbol column and an optional 'category' column
+        diseases: list of (condition, efo_id) pairs, e.g. [("Breast Cancer", "EFO_0000305")]
+    Returns:
+        long-format DataFrame with one row per gene and disease:
+            {gene, condition, efo_id, category, studies, FDA_Approved_Drug, DGIdb_Status,
+             DGIdb_Interactions, DGIdb_Drugs, OpenTargets_Score, Strong_Disease_Support,
+             Has_FDA_Drug}
+
+    DGIdb and Open Targets drug lookups run once per unique gene, Open Targets disease
+    scores once per unique EFO ID and ClinicalTrials searches once per unique
+    (gene, condition) pair, so results are shared across diseases. Per-gene and
+    per-(gene, condition) requests run on up to max_workers threads, each API
+    behind a shared rate limiter. As in the original breast cancer summary, genes
+    without an Ensembl ID get an OpenTargets_Score of 0. Gene symbols keep the
+    caller's spelling in API calls and output; DGIdb and disease-score lookups
+    match them case-insensitively.
+    """
+    diseases = list(dict.fromkeys((condition, efo_id) for condition, efo_id in diseases))
+    if not diseases:
+        raise ValueError("diseases must contain at least one (condition, efo_id) pair")
+
+    table = gene_table.dropna(subset=[gene_column]).copy()
+    table['gene'] = table[gene_column].astype(str).str.strip()
+    table = table[table['gene'] != '']
+    if 'category' not in table.columns:
+        table['category'] = None
+    table = table[['gene', 'category']].drop_duplicates()
+    genes = table['gene'].drop_duplicates().tolist()
+    if not genes:
+        raise ValueError(f"gene_table has no genes in column '{gene_column}'")
+
+    # Disease independent lookups, once per unique gene
+    dgidb_status_df = build_dgidb_status(genes, interactions_db)
+    df_drugs = fetch_gene_drugs(genes, max_workers=max_workers)
+
+    # Open Targets association scores, once per unique disease
+    score_rows = []
+    for efo_id in dict.fromkeys(efo_id for _, efo_id in diseases):
+        score_lookup = fetch_disease_scores(efo_id)
+        score_rows.extend({'gene': gene, 'efo_id': efo_id, 'OpenTargets_Score': score_lookup.get(gene.upper(), 0.0)}
+                          for gene in genes)
+    df_scores = pd.DataFrame(score_rows, columns=['gene', 'efo_id', 'OpenTargets_Score'])
+
+    # ClinicalTrials searches, once per unique (gene, condition)
+    df_counts = count_studies(genes, [condition for condition, _ in diseases],
+                              max_workers=max_workers, delay=request_delay)
+
+    # Resolve genes listed under several categories per condition, as in assign_priority_category
+    df_diseases = pd.DataFrame(diseases, columns=['condition', 'efo_id'])
+    df_long = table.merge(df_counts, on='gene', how='left')
+    if table['category'].notna().any():
+        assigned = []
+        for condition, group in df_long.groupby('condition', sort=False):
+            df_final, _ = assign_priority_category(
+                group.rename(columns={'studies': 'studies_found'})[['category', 'gene', 'studies_found']])
+            df_final['condition'] = condition
+            assigned.append(df_final)
+        df_long = pd.concat(assigned, ignore_index=True)
     else:
-        drug_map[gene] = 'No Specific Drug'
-        score_map[gene] = 0
-    
-    time.sleep(0.3)  # Slightly longer delay to respect API rate limits
-
-# Create DataFrames for each data type
-df_drugs = pd.DataFrame({
-    'gene': list(drug_map.keys()),
-    'FDA_Approved_Drug': list(drug_map.values())
-})
-
-df_scores = pd.DataFrame({
-    'gene': list(score_map.keys()),
-    'OpenTargets_Score': list(score_map.values())
-})
-
-# Merge all data into the final dataframe
-enriched_df = df_final.merge(df_drugs, on='gene', how='left')
-enriched_df = enriched_df.merge(dgidb_status_df, on='gene', how='left')
-enriched_df = enriched_df.merge(df_scores, on='gene', how='left')
-
-# Fill missing values
-enriched_df['FDA_Approved_Drug'] = enriched_df['FDA_Approved_Drug'].fillna('No Specific Drug')
-enriched_df['DGIdb_Status'] = enriched_df['DGIdb_Status'].fillna('Not Targeted')
-enriched_df['OpenTargets_Score'] = enriched_df['OpenTargets_Score'].fillna(0)
-
-# Add derived columns for analysis
-enriched_df['Strong_BreastCancer_Support'] = enriched_df['OpenTargets_Score'] >= 0.5
-enriched_df['Has_FDA_Drug'] = enriched_df['FDA_Approved_Drug'].apply(lambda x: "Yes" if x != 'No Specific Drug' else "No")
-
-enriched_df.to_csv(assets / "Clinical_Trials_Summary.csv", index=False)
\ No newline at end of file
+        df_long = df_long.drop_duplicates(subset=['gene', 'condition'])
+
+    enriched_df = df_long.merge(df_diseases, on='condition', how='left')
+    enriched_df = enriched_df.merge(df_drugs, on='gene', how='left')
+    enriched_df = enriched_df.merge(dgidb_status_df, on='gene', how='left')
+    enriched_df = enriched_df.merge(df_scores, on=['gene', 'efo_id'], how='left')
+
+    # Fill missing values
+    enriched_df['FDA_Approved_Drug'] = enriched_df['FDA_Approved_Drug'].fillna('No Specific Drug')
+    enriched_df['DGIdb_Status'] = enriched_df['DGIdb_Status'].fillna('Not Targeted')
+    enriched_df['OpenTargets_Score'] = enriched_df['OpenTargets_Score'].fillna(0)
+    enriched_df.loc[~enriched_df['Has_Ensembl_ID'].astype(bool), 'OpenTargets_Score'] = 0.0
+
+    # Add derived columns for analysis
+    enriched_df['Strong_Disease_Support'] = enriched_df['OpenTargets_Score'] >= STRONG_SUPPORT_THRESHOLD
+    enriched_df['Has_FDA_Drug'] = (enriched_df['FDA_Approved_Drug'] != 'No Specific Drug').map({True: "Yes", False: "No"})
+
+    columns = ['gene', 'condition', 'efo_id', 'category', 'studies', 'FDA_Approved_Drug',
+               'DGIdb_Status', 'DGIdb_Interactions', 'DGIdb_Drugs', 'OpenTargets_Score',
+               'Strong_Disease_Support', 'Has_FDA_Drug']
+    return enriched_df[columns].sort_values(by=['condition', 'gene']).reset_index(drop=True)
+
+def breast_cancer_summary():
+    """
+    Original single-disease run on the hand-curated gene_categories, writing
+    Clinical_Trials_Summary.csv and OpenTargets_Score.csv to the assets folder.
+    """
+    gene_table = pd.DataFrame(
+        [(gene, category) for category, genes in gene_categories.items() for gene in genes],
+        columns=['gene', 'category']
+    )
+    enriched_df = run_batch_enrichment(gene_table, DEFAULT_DISEASES)
+
+    score_lookup = fetch_disease_scores(DISEASE_EFO)
+    score_lookup_df = pd.DataFrame(score_lookup, index=[0]).T.reset_index()
+    score_lookup_df.columns = ['gene', 'OpenTargets_Score']
+    score_lookup_df.to_csv(assets / "OpenTargets_Score.csv", index=False)
+
+    enriched_df = enriched_df.rename(columns={'Strong_Disease_Support': 'Strong_BreastCancer_Support'})
+    enriched_df = enriched_df.drop(columns=['condition', 'efo_id'])
+    enriched_df.to_csv(assets / "Clinical_Trials_Summary.csv", index=False)
+    return enriched_df
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Enrich genes with ClinicalTrials, Open Targets and DGIdb data. "
+                    "Without --genes, runs the original breast cancer summary.")
+    parser.add_argument("--genes", type=Path,
+                        help="CSV file with a gene column and an optional 'category' column")
+    parser.add_argument("--gene-column", default="gene",
+                        help="name of the gene symbol column in --genes (default: gene)")
+    parser.add_argument("--disease", nargs=2, action="append", metavar=("CONDITION", "EFO_ID"),
+                        help="condition and EFO ID pair, may be repeated")
+    parser.add_argument("--diseases-file", type=Path,
+                        help="CSV file with 'condition' and 'efo_id' columns")
+    parser.add_argument("--max-workers", type=int, default=MAX_WORKERS,
+                        help=f"concurrent API requests (default: {MAX_WORKERS})")
+    parser.add_argument("--request-delay", type=float, default=REQUEST_DELAY,
+                        help=f"minimum seconds between ClinicalTrials requests (default: {REQUEST_DELAY})")
+    parser.add_argument("--output", type=Path, default=assets / "Batch_Enrichment.csv",
+                        help="output CSV path (default: assets/Batch_Enrichment.csv)")
+    return parser.parse_args()
+
+def main():
+    args = parse_args()
+    if args.genes is None:
+        breast_cancer_summary()
+        return
+
+    diseases = [tuple(pair) for pair in (args.disease or [])]
+    if args.diseases_file is not None:
+        df_diseases = pd.read_csv(args.diseases_file)
+        diseases += list(df_diseases[['condition', 'efo_id']].itertuples(index=False, name=None))
+    if not diseases:
+        diseases = DEFAULT_DISEASES
+
+    gene_table = pd.read_csv(args.genes)
+    enriched_df = run_batch_enrichment(gene_table, diseases, gene_column=args.gene_column,
+                                       max_workers=args.max_workers, request_delay=args.request_delay)
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    enriched_df.to_csv(args.output, index=False)
+    print(f"Saved {len(enriched_df)} enrichment rows to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -1,29 +1,160 @@
 """
 Script to download interactions.tsv file from DGIdb and store it in assets folder.
 This file contains drug-gene interaction data needed for breast cancer gene analysis.
+
+The raw TSV is compiled into an indexed SQLite store (interactions.sqlite) so the
+enrichment steps can look up gene -> interactions, drug -> genes and approved-only
+interactions without re-reading the full dump.
 """
 
+import os
+import sqlite3
 import requests
+import pandas as pd
 from pathlib import Path
 
+DGIDB_URL = "https://dgidb.org/data/latest/interactions.tsv"
+INTERACTIONS_TABLE = "interactions"
+CHUNK_SIZE = 100_000      # rows per chunk when compiling the TSV into SQLite
+QUERY_BATCH_SIZE = 500    # genes per IN (...) query
+
+# Columns kept from the DGIdb dump; flags are stored as 0/1 integers
+TEXT_COLUMNS = [
+    "gene_name", "gene_claim_name", "gene_concept_id",
+    "drug_name", "drug_claim_name", "drug_concept_id",
+    "interaction_type", "interaction_source_db_name",
+]
+FLAG_COLUMNS = ["approved", "immunotherapy", "anti_neoplastic"]
+SCORE_COLUMN = "interaction_score"
+
+
+def download_tsv_file(url: str, dest_path: Path):
+    """Download the DGIdb interactions TSV from the given URL."""
+    dest_path.parent.mkdir(parents=True, exist_ok=True)
+    response = requests.get(url, stream=True, timeout=60)
+    response.raise_for_status()
+    with open(dest_path, 'wb') as f:
+        for chunk in response.iter_content(chunk_size=8192):
+            f.write(chunk)
+    print(f"Successfully downloaded TSV file to: {dest_path}")
+
+
+def _to_flag(series):
+    """Convert a DGIdb True/False column (bool or string) to 0/1 integers."""
+    return series.astype(str).str.strip().str.lower().eq("true").astype(int)
+
+
+def compile_interactions_db(tsv_path: Path, db_path: Path):
+    """
+    Compile the DGIdb TSV into a SQLite database with gene and drug indexes.
+    Gene and drug names are upper-cased so lookups are case-insensitive.
+    The store is built in a temporary file and only replaces db_path once it
+    is complete, so a failed rebuild leaves the previous store in place.
+    """
+    tmp_path = db_path.with_name(db_path.name + ".tmp")
+    if tmp_path.exists():
+        tmp_path.unlink()
+
+    conn = sqlite3.connect(tmp_path)
+    try:
+        n_rows = 0
+        for chunk in pd.read_csv(tsv_path, sep="\t", chunksize=CHUNK_SIZE, dtype=str):
+            for col in TEXT_COLUMNS + FLAG_COLUMNS + [SCORE_COLUMN]:
+                if col not in chunk.columns:
+                    chunk[col] = None
+            chunk = chunk[TEXT_COLUMNS + FLAG_COLUMNS + [SCORE_COLUMN]].copy()
+            chunk = chunk.dropna(subset=["gene_name"])
+            chunk["gene_name"] = chunk["gene_name"].str.upper()
+            chunk["drug_name"] = chunk["drug_name"].str.upper()
+            for col in FLAG_COLUMNS:
+                chunk[col] = _to_flag(chunk[col])
+            chunk[SCORE_COLUMN] = pd.to_numeric(chunk[SCORE_COLUMN], errors="coerce")
+            chunk.to_sql(INTERACTIONS_TABLE, conn, if_exists="append", index=False)
+            n_rows += len(chunk)
+
+        conn.execute(f"CREATE INDEX idx_gene ON {INTERACTIONS_TABLE} (gene_name)")
+        conn.execute(f"CREATE INDEX idx_drug ON {INTERACTIONS_TABLE} (drug_name)")
+        conn.execute(f"CREATE INDEX idx_approved ON {INTERACTIONS_TABLE} (approved, gene_name)")
+        conn.commit()
+    except Exception:
+        conn.close()
+        tmp_path.unlink()
+        raise
+    conn.close()
+    os.replace(tmp_path, db_path)
+    print(f"Successfully compiled {n_rows} interactions to: {db_path}")
+
+
+def _query(db_path: Path, sql: str, params=()):
+    """Run a read-only query against the interactions store and return a DataFrame."""
+    if not Path(db_path).exists():
+        raise FileNotFoundError(
+            f"DGIdb interaction store not found at {db_path}. "
+            "Run `python scripts/Interactions_asset.py` to download and build it."
+        )
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        return pd.read_sql_query(sql, conn, params=list(params))
+    finally:
+        conn.close()
+
+
+def query_gene_interactions(db_path: Path, genes, approved_only=False):
+    """
+    Return all interactions (drug, type, score, flags) for the given gene symbols.
+    """
+    genes = sorted({g.upper() for g in genes if isinstance(g, str)})
+    if not genes:
+        return _query(db_path, f"SELECT * FROM {INTERACTIONS_TABLE} WHERE 0")
+    # Query in batches to stay under SQLite's bound parameter limit
+    frames = []
+    for start in range(0, len(genes), QUERY_BATCH_SIZE):
+        batch = genes[start:start + QUERY_BATCH_SIZE]
+        placeholders = ", ".join("?" for _ in batch)
+        sql = f"SELECT * FROM {INTERACTIONS_TABLE} WHERE gene_name IN ({placeholders})"
+        if approved_only:
+            sql += " AND approved = 1"
+        frames.append(_query(db_path, sql, batch))
+    return pd.concat(frames, ignore_index=True)
+
+
+def query_drug_genes(db_path: Path, drug_name):
+    """Return the sorted list of genes that interact with the given drug."""
+    df = _query(
+        db_path,
+        f"SELECT DISTINCT gene_name FROM {INTERACTIONS_TABLE} WHERE drug_name = ?",
+        [drug_name.upper()],
+    )
+    return sorted(df["gene_name"].tolist())
+
+
+def query_approved_interactions(db_path: Path):
+    """Return all interactions involving an approved drug."""
+    return _query(db_path, f"SELECT * FROM {INTERACTIONS_TABLE} WHERE approved = 1")
+
+
+def load_targeted_genes(db_path: Path, approved_or_antineoplastic=False):
+    """
+    Return the set of gene symbols with at least one interaction.
+    If approved_or_antineoplastic is True, only count approved or anti-neoplastic drugs.
+    """
+    sql = f"SELECT DISTINCT gene_name FROM {INTERACTIONS_TABLE}"
+    if approved_or_antineoplastic:
+        sql += " WHERE approved = 1 OR anti_neoplastic = 1"
+    return set(_query(db_path, sql)["gene_name"])
+
+
 def main():
-    # Set destination path
+    # Set destination paths
     assets = Path("assets/")
     destination_file = assets / "interactions.tsv"
-    
-    # DGIdb URL for interactions data
-    url = "https://dgidb.org/data/latest/interactions.tsv"
-    
+    db_file = assets / "interactions.sqlite"
+
     print(f"Downloading interactions.tsv from DGIdb...")
-    
-    # Download the file
-    response = requests.get(url)
-    
-    # Save the file
-    with open(destination_file, 'wb') as file:
-        file.write(response.content)
-    
-    print(f"File downloaded and saved to {destination_file}")
+    download_tsv_file(DGIDB_URL, destination_file)
+
+    # Build the indexed store used by the enrichment steps
+    compile_interactions_db(destination_file, db_file)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
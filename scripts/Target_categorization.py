@@ -0,0 +1,165 @@
+"""
+Vectorized target categorization and Sankey link building used by
+Clinical_trial_asset.py and notebooks/10_Combined_DE.ipynb.
+
+Each function works on whole columns (groupby/sort/np.select) instead of
+row-wise apply or iterrows, so 100k-gene tables are categorized in well
+under a second.
+"""
+
+import numpy as np
+import pandas as pd
+
+FDA_CATEGORY = "FDA-approved for Cancer Therapy"
+EMERGING_CATEGORY = "Emerging Breast Cancer Target"
+LACKS_CATEGORY = "Lacks Breast Cancer Evidence"
+
+FDA_BC_SUBCATEGORY = "FDA-approved for Breast Cancer"
+FDA_OTHER_SUBCATEGORY = "FDA-approved, Other Indication"
+
+IN_TRIAL_STATUS = "In Breast Cancer Trial"
+NO_TRIAL_STATUS = "No Breast Cancer Trial"
+
+STRONG_SUPPORT_THRESHOLD = 0.5
+
+
+def assign_priority_category(df_summary):
+    """
+    Input:
+        df_summary: DataFrame with rows {category, gene, studies_found}
+    Returns:
+        df_final: DataFrame with one row per gene:
+                    {gene, category, studies}
+        category_priority: list of categories ordered by total studies (desc)
+    """
+
+    # Compute global category priority by total studies (desc)
+    cat_totals = df_summary.groupby('category')['studies_found'].sum().sort_values(ascending=False)
+    category_priority = list(cat_totals.index)
+    priority_index = {cat: i for i, cat in enumerate(category_priority)}
+
+    # For each gene, choose the category with:
+    #  a) lowest priority_index (i.e., highest priority)
+    #  b) if tied, the highest per-gene studies_found
+    #  c) if still tied, the first category in alphabetical order
+    ranked = df_summary.assign(priority_idx=df_summary['category'].map(priority_index))
+    ranked = ranked.sort_values(by=['gene', 'priority_idx', 'studies_found', 'category'],
+                                ascending=[True, True, False, True])
+    chosen = ranked.drop_duplicates(subset='gene', keep='first')
+
+    df_final = pd.DataFrame({
+        'gene': chosen['gene'].to_numpy(),
+        'category': chosen['category'].to_numpy(),
+        'studies': chosen['studies_found'].astype(int).to_numpy()
+    })
+    df_final = df_final.sort_values(by='gene').reset_index(drop=True)
+    return df_final, category_priority
+
+
+def assign_targeting_category(df, support_col="Strong_BreastCancer_Support",
+                              dgidb_col="DGIdb Status", fda_col="FDA_Approved_Drug"):
+    """
+    Return the therapeutic targeting category for every row of df:
+    strongly supported, DGIdb-targeted genes with an FDA-approved drug are
+    FDA-approved, those without one are Emerging, everything else Lacks Evidence.
+    """
+    strong = df[support_col].astype(bool).to_numpy()
+    targeted = (df[dgidb_col] == "Targeted").to_numpy()
+    fda = (df[fda_col] == "Yes").to_numpy()
+
+    categories = np.select(
+        [strong & targeted & fda, strong & targeted],
+        [FDA_CATEGORY, EMERGING_CATEGORY],
+        default=LACKS_CATEGORY
+    )
+    return pd.Series(categories, index=df.index)
+
+
+def fda_subcategory(df, bc_approved_genes, category_col="Targeting Category", gene_col="Gene"):
+    """
+    Split FDA-approved rows into breast cancer and other indications.
+    Rows outside the FDA-approved category get None.
+    """
+    is_fda = (df[category_col] == FDA_CATEGORY).to_numpy()
+    is_bc = df[gene_col].isin(bc_approved_genes).to_numpy()
+
+    subcategories = np.select(
+        [is_fda & is_bc, is_fda],
+        [FDA_BC_SUBCATEGORY, FDA_OTHER_SUBCATEGORY],
+        default=None
+    )
+    return pd.Series(subcategories, index=df.index)
+
+
+def clinical_trial_status(df, score_col="OpenTargets_Score",
+                          support_col="Strong_BreastCancer_Support"):
+    """
+    Infer clinical trial status from the Open Targets score and support flag.
+    """
+    score = df[score_col]
+    in_trial = (score.notna() & (score >= STRONG_SUPPORT_THRESHOLD)).to_numpy() \
+        | df[support_col].astype(bool).to_numpy()
+
+    statuses = np.where(in_trial, IN_TRIAL_STATUS, NO_TRIAL_STATUS)
+    return pd.Series(statuses, index=df.index)
+
+
+def build_sankey_labels(df, columns):
+    """
+    Return the Sankey node labels (unique values of each column, in order of
+    appearance, concatenated) and a label -> node index mapping.
+    """
+    labels = []
+    for col in columns:
+        labels += df[col].unique().tolist()
+    label_to_idx = {label: i for i, label in enumerate(labels)}
+    return labels, label_to_idx
+
+
+def build_sankey_links(df, columns, label_to_idx):
+    """
+    Build Sankey links between each consecutive pair of columns.
+
+    All levels are stacked into one frame and counted with a single
+    groupby().size(), so each (source, target) pair becomes one link whose
+    value is the number of rows sharing it. Rows with a missing label are
+    counted against that label's node; a label absent from label_to_idx
+    raises ValueError. Returns a DataFrame with
+    {level, source_label, target_label, source, target, value}, ordered by
+    level, then source and target node index.
+    """
+    pairs = pd.concat(
+        [
+            pd.DataFrame({
+                'level': level,
+                'source_label': df[source_col].to_numpy(),
+                'target_label': df[target_col].to_numpy(),
+            })
+            for level, (source_col, target_col) in enumerate(zip(columns[:-1], columns[1:]))
+        ],
+        ignore_index=True
+    )
+
+    pairs['source'] = pairs['source_label'].map(label_to_idx)
+    pairs['target'] = pairs['target_label'].map(label_to_idx)
+    unknown = pairs['source'].isna() | pairs['target'].isna()
+    if unknown.any():
+        missing = pd.concat([pairs.loc[pairs['source'].isna(), 'source_label'],
+                             pairs.loc[pairs['target'].isna(), 'target_label']]).unique().tolist()
+        raise ValueError(f"Sankey labels missing from label_to_idx: {missing}")
+
+    # Group on node indices so rows with missing labels are counted like any other node
+    links = pairs.groupby(['level', 'source', 'target'], sort=False).size()
+    links = links.reset_index(name='value')
+    links = links.sort_values(by=['level', 'source', 'target'], kind='stable')
+
+    idx_to_label = {i: label for label, i in label_to_idx.items()}
+    links['source_label'] = links['source'].map(idx_to_label)
+    links['target_label'] = links['target'].map(idx_to_label)
+    links[['source', 'target']] = links[['source', 'target']].astype(int)
+    return links[['level', 'source_label', 'target_label', 'source', 'target', 'value']].reset_index(drop=True)
+
+
+def map_colors(labels, color_map, default="lightgray"):
+    """Map node or link labels to colors, falling back to default."""
+    return pd.Series(labels, dtype=object).map(color_map).fillna(default).tolist()